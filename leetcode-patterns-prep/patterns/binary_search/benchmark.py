@@ -0,0 +1,168 @@
+"""
+Binary Search — Benchmark Runner
+Times each template against the stdlib bisect module and prints JSON.
+
+Usage:
+    python benchmark.py                                  # 10^3 .. 10^6
+    python benchmark.py --sizes 1000 100000000 --queries 20000 -o bench.json
+
+Arrays are stored as array('q') (8 bytes per key), so 10^8 keys need ~0.8 GB,
+plus one rotated copy for search_rotated.
+"""
+
+import argparse
+import importlib.util
+import json
+import platform
+import random
+import sys
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+DISTRIBUTIONS = ("hit", "miss", "dup")
+DUP_RUN = 16  # each key repeated this many times in the "dup" distribution
+
+
+def load_template(relative_path):
+    """Templates live in plain folders (not packages), so load them by path."""
+    path = HERE / relative_path
+    spec = importlib.util.spec_from_file_location(path.parent.name + "_template", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+master = load_template("template.py")
+classic = load_template("subpatterns/classic_binary_search/template.py")
+boundary = load_template("subpatterns/boundary_binary_search/template.py")
+rotated = load_template("subpatterns/modified_binary_search_rotated/template.py")
+
+
+# ─── DATA ─────────────────────────────────────────────────────────
+def build_array(n, distribution):
+    """Sorted keys: even numbers (hit/miss) or runs of DUP_RUN equal keys (dup)."""
+    if distribution == "dup":
+        return array("q", (i // DUP_RUN * 2 for i in range(n)))
+    return array("q", range(0, 2 * n, 2))
+
+
+def build_queries(arr, count, distribution, rng):
+    if distribution == "miss":
+        return [2 * rng.randrange(len(arr)) + 1 for _ in range(count)]  # odd = absent
+    return [arr[rng.randrange(len(arr))] for _ in range(count)]
+
+
+# ─── CASES ────────────────────────────────────────────────────────
+# name -> (template call, equivalent bisect baseline). Each takes (arr, q).
+CASES = {
+    "binary_search_classic": (
+        master.binary_search_classic,
+        lambda arr, q: bisect_left(arr, q),
+    ),
+    "first_true": (
+        lambda arr, q: master.first_true(arr, lambda x: x >= q),
+        lambda arr, q: bisect_left(arr, q),
+    ),
+    "find_first": (
+        boundary.find_first,
+        lambda arr, q: bisect_left(arr, q),
+    ),
+    "find_last": (
+        boundary.find_last,
+        lambda arr, q: bisect_right(arr, q) - 1,
+    ),
+    "search_insert_position": (
+        classic.search_insert_position,
+        lambda arr, q: bisect_left(arr, q),
+    ),
+    "search_rotated": (
+        rotated.search_rotated,
+        lambda arr, q: bisect_left(arr, q),  # timed on the unrotated array
+    ),
+}
+
+
+def time_queries(func, arr, queries, repeat):
+    """Best-of-repeat wall time for running func over every query."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for q in queries:
+            func(arr, q)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(sizes, distributions, cases, query_count, repeat, seed):
+    rng = random.Random(seed)
+    results = []
+
+    for n in sizes:
+        for distribution in distributions:
+            arr = build_array(n, distribution)
+            queries = build_queries(arr, query_count, distribution, rng)
+
+            for name in cases:
+                func, baseline = CASES[name]
+                data = arr
+                if name == "search_rotated":
+                    if distribution == "dup":
+                        continue  # template assumes distinct keys
+                    pivot = n // 3
+                    data = arr[pivot:] + arr[:pivot]
+
+                seconds = time_queries(func, data, queries, repeat)
+                baseline_seconds = time_queries(baseline, arr, queries, repeat)
+
+                results.append({
+                    "func": name,
+                    "size": n,
+                    "distribution": distribution,
+                    "queries": len(queries),
+                    "seconds": seconds,
+                    "ns_per_query": seconds / len(queries) * 1e9,
+                    "bisect_ns_per_query": baseline_seconds / len(queries) * 1e9,
+                    "slowdown_vs_bisect": seconds / baseline_seconds if baseline_seconds else None,
+                })
+
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+",
+                        default=[10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6])
+    parser.add_argument("--distributions", nargs="+", choices=DISTRIBUTIONS,
+                        default=list(DISTRIBUTIONS))
+    parser.add_argument("--funcs", nargs="+", choices=list(CASES), default=list(CASES))
+    parser.add_argument("--queries", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-o", "--output", help="write JSON here instead of stdout")
+    args = parser.parse_args(argv)
+
+    report = {
+        "meta": {
+            "python": sys.version.split()[0],
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "queries": args.queries,
+            "repeat": args.repeat,
+            "seed": args.seed,
+        },
+        "results": run(args.sizes, args.distributions, args.funcs,
+                       args.queries, args.repeat, args.seed),
+    }
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,8 +3,15 @@ Binary Search on Answer Space — Template
 """
 
 import math
+from bisect import bisect_right
+from itertools import accumulate
 from typing import List
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; engines fall back to pure Python
+    np = None
+
 
 def koko_eating_bananas_style(piles: List[int], h: int) -> int:
     """
@@ -57,3 +64,108 @@ def capacity_to_ship_style(weights: List[int], days: int) -> int:
             lo = mid + 1
 
     return lo
+
+
+class PileHours:
+    """
+    Preprocess piles once, then answer hours(speed) = sum(ceil(pile / speed)).
+    Exact integer math throughout (no float ceil).
+    Large speeds: count piles above each multiple of speed on the sorted
+    piles -> O((max / speed) * log N) instead of O(N).
+    Small speeds: one vectorized ceil-division pass (NumPy if available).
+    """
+
+    def __init__(self, piles):
+        self.n = len(piles)
+        if np is not None:
+            self.piles = np.sort(np.asarray(piles, dtype=np.int64))
+        else:
+            self.piles = sorted(piles)
+        self.total = int(self.piles.sum()) if np is not None else sum(self.piles)
+        self.max = int(self.piles[-1])
+
+    def hours(self, speed):
+        n, piles = self.n, self.piles
+        buckets = -(-self.max // speed)  # number of distinct ceil values
+
+        if buckets * n.bit_length() < n:
+            # Each pile > j * speed owes one hour for every j in [0, buckets)
+            if np is not None:
+                thresholds = np.arange(buckets, dtype=np.int64) * speed
+                return n * buckets - int(np.searchsorted(piles, thresholds, side="right").sum())
+            return sum(n - bisect_right(piles, j * speed) for j in range(buckets))
+
+        if np is not None:
+            return int(((piles + (speed - 1)) // speed).sum())
+        return sum((pile + speed - 1) // speed for pile in piles)
+
+
+def koko_eating_bananas_fast(piles: List[int], h: int) -> int:
+    """
+    Same answer as koko_eating_bananas_style, built on PileHours.
+    Also tightens lo: no speed below ceil(total / h) can ever work.
+    """
+    engine = PileHours(piles)
+    lo = max(1, -(-engine.total // h))
+    hi = engine.max
+
+    while lo < hi:
+        mid = lo + (hi - lo) // 2
+        if engine.hours(mid) <= h:
+            hi = mid
+        else:
+            lo = mid + 1
+
+    return lo
+
+
+class PrefixPartition:
+    """
+    Precomputed prefix sums for "split a sequence into contiguous groups,
+    each with sum <= cap" checks (ship within D days, split array largest sum).
+    Each check jumps group boundary to group boundary with bisect:
+    O(groups * log N) instead of walking every element.
+    """
+
+    def __init__(self, weights):
+        self.n = len(weights)
+        self.prefix = list(accumulate(weights, initial=0))
+        self.max = max(weights)
+        self.total = self.prefix[-1]
+
+    def groups_needed(self, cap, limit=None):
+        """Greedy group count at capacity cap. Stops early once past limit."""
+        if cap < self.max:
+            return math.inf  # some single item never fits
+        prefix, n = self.prefix, self.n
+        i, groups = 0, 0
+        while i < n:
+            # Furthest j with prefix[j] - prefix[i] <= cap
+            i = bisect_right(prefix, prefix[i] + cap, i + 1) - 1
+            groups += 1
+            if limit is not None and groups > limit:
+                break
+        return groups
+
+    def min_capacity(self, groups):
+        """Smallest cap that splits everything into at most `groups` groups."""
+        lo, hi = max(self.max, -(-self.total // groups)), self.total
+
+        while lo < hi:
+            mid = lo + (hi - lo) // 2
+            if self.groups_needed(mid, groups) <= groups:
+                hi = mid
+            else:
+                lo = mid + 1
+
+        return lo
+
+
+def capacity_to_ship_fast(weights: List[int], days: int) -> int:
+    """Same answer as capacity_to_ship_style, using PrefixPartition."""
+    return PrefixPartition(weights).min_capacity(days)
+
+
+def split_array_largest_sum_fast(nums: List[int], k: int) -> int:
+    """Split Array Largest Sum is the same search: k groups, minimize max sum."""
+    return PrefixPartition(nums).min_capacity(k)
@@ -2,6 +2,9 @@
 Boundary Binary Search (First/Last Occurrence) — Template
 """
 
+from array import array
+from bisect import bisect_left, bisect_right, insort
+
 
 def find_first(arr, target):
     """Find leftmost index of target. Return -1 if not found."""
@@ -51,3 +54,278 @@ def first_bad_version(n, isBadVersion):
             left = mid + 1     # mid is good, first bad is after
 
     return left
+
+
+class MonotoneSearcher:
+    """
+    Wraps an expensive monotone predicate (False ... False True ... True).
+    Every result is cached, so no point is ever probed twice, and
+    `calls` counts the real predicate invocations.
+    """
+
+    def __init__(self, predicate):
+        self.predicate = predicate
+        self.cache = {}
+        self.calls = 0
+
+    def __call__(self, x):
+        if x not in self.cache:
+            self.calls += 1
+            self.cache[x] = self.predicate(x)
+        return self.cache[x]
+
+    def first_true(self, lo, hi):
+        """First x in [lo..hi] with predicate True (assumes hi is True)."""
+        while lo < hi:
+            mid = lo + (hi - lo) // 2
+            if self(mid):
+                hi = mid
+            else:
+                lo = mid + 1
+        return lo
+
+    def gallop(self, lo=0, hi=None):
+        """
+        Exponential search from lo: probe lo, lo+1, lo+3, lo+7, ...
+        O(log k) probes when the answer is k steps from lo.
+        hi may be None (unbounded) or a known True upper limit.
+        """
+        step = 1
+        prev = lo - 1       # last point known to be False
+        probe = lo
+        while hi is None or probe < hi:
+            if self(probe):
+                return self.first_true(prev + 1, probe)
+            prev = probe
+            probe = lo + 2 * step - 1
+            step *= 2
+        return self.first_true(prev + 1, hi)
+
+
+class StaticSortedIndex:
+    """
+    Build-once search index over a sorted array (Eytzinger layout).
+    Node k has children 2k and 2k+1, so the first levels of every search
+    share the same few cache lines. All results are indices into the
+    ORIGINAL sorted array.
+    """
+
+    def __init__(self, sorted_arr):
+        n = len(sorted_arr)
+        self.n = n
+        if isinstance(sorted_arr, array):
+            self.tree = array(sorted_arr.typecode, bytes(sorted_arr.itemsize * (n + 1)))
+        else:
+            self.tree = [None] * (n + 1)      # slot 0 unused (1-indexed tree)
+        self.rank = array("q", [n]) * (n + 1)  # tree slot -> original index
+
+        # In-order walk of the implicit tree fills it with sorted_arr in order
+        i, k, stack = 0, 1, []
+        while stack or k <= n:
+            while k <= n:
+                stack.append(k)
+                k = 2 * k
+            k = stack.pop()
+            self.tree[k] = sorted_arr[i]
+            self.rank[k] = i
+            i += 1
+            k = 2 * k + 1
+
+    def _descend(self, target, strict):
+        """Walk root to leaf, then undo the trailing right turns."""
+        tree, n, k = self.tree, self.n, 1
+        if strict:
+            while k <= n:
+                k = 2 * k + (tree[k] <= target)
+        else:
+            while k <= n:
+                k = 2 * k + (tree[k] < target)
+        return k >> (k ^ (k + 1)).bit_length()  # drop trailing 1s plus one 0
+
+    def lower_bound(self, target):
+        """First index with arr[i] >= target (n if none)."""
+        return self.rank[self._descend(target, strict=False)]  # rank[0] == n
+
+    def upper_bound(self, target):
+        """First index with arr[i] > target (n if none)."""
+        return self.rank[self._descend(target, strict=True)]
+
+    def find(self, target):
+        """Leftmost index of target, or -1 (same contract as find_first)."""
+        k = self._descend(target, strict=False)
+        if k and self.tree[k] == target:
+            return self.rank[k]
+        return -1
+
+    def count_range(self, lo, hi):
+        """Number of elements with lo <= arr[i] <= hi."""
+        return max(0, self.upper_bound(hi) - self.lower_bound(lo))
+
+
+class BlockedSortedList:
+    """
+    Sorted multiset for a live stream: sorted sublists ("blocks") of about
+    `load` items plus the max of each block. bisect on the maxes picks the
+    block, bisect inside the block finishes the job.
+    - A Fenwick tree over block sizes turns a block number into a global
+      offset in O(log B); it is rebuilt lazily after a split or merge.
+    - Blocks split above 2 * load and merge with a neighbour below load // 2.
+    add/remove: O(log N + load). Positional queries: O(log N).
+    """
+
+    def __init__(self, iterable=(), load=1000):
+        values = sorted(iterable)
+        self.load = load
+        self.blocks = [values[i:i + load] for i in range(0, len(values), load)]
+        self.maxes = [block[-1] for block in self.blocks]
+        self.size = len(values)
+        self.index = None                   # Fenwick tree over len(block)
+
+    def __len__(self):
+        return self.size
+
+    # ─── block-size index ──────────────────────────────────────────
+    def _index(self):
+        """Fenwick tree (1-based) over block sizes, built in O(B) on demand."""
+        if self.index is None:
+            tree = [0] + [len(block) for block in self.blocks]
+            for i in range(1, len(tree)):
+                j = i + (i & -i)
+                if j < len(tree):
+                    tree[j] += tree[i]
+            self.index = tree
+        return self.index
+
+    def _resize(self, b, delta):
+        """Block b grew or shrank by delta items (no split/merge)."""
+        tree = self.index
+        if tree is None:
+            return
+        i = b + 1
+        while i < len(tree):
+            tree[i] += delta
+            i += i & -i
+
+    def _offset(self, b):
+        """Number of items in blocks[:b]."""
+        tree, total = self._index(), 0
+        while b:
+            total += tree[b]
+            b -= b & -b
+        return total
+
+    def _merge(self, b):
+        """Fold underfull block b into a neighbour, re-splitting if too big."""
+        if b == len(self.blocks) - 1:
+            b -= 1                          # last block: merge with the left one
+        block = self.blocks[b] + self.blocks[b + 1]
+        if len(block) > 2 * self.load:
+            half = len(block) // 2
+            self.blocks[b:b + 2] = [block[:half], block[half:]]
+            self.maxes[b:b + 2] = [block[half - 1], block[-1]]
+        else:
+            self.blocks[b:b + 2] = [block]
+            self.maxes[b:b + 2] = [block[-1]]
+        self.index = None
+
+    # ─── updates ───────────────────────────────────────────────────
+    def add(self, value):
+        if not self.blocks:
+            self.blocks.append([value])
+            self.maxes.append(value)
+            self.size = 1
+            self.index = None
+            return
+
+        b = bisect_left(self.maxes, value)
+        if b == len(self.blocks):
+            b -= 1                          # bigger than everything: last block
+        block = self.blocks[b]
+        insort(block, value)
+        self.maxes[b] = block[-1]
+        self.size += 1
+
+        if len(block) > 2 * self.load:      # split oversized block in half
+            half = len(block) // 2
+            self.blocks[b:b + 1] = [block[:half], block[half:]]
+            self.maxes[b:b + 1] = [block[half - 1], block[-1]]
+            self.index = None
+        else:
+            self._resize(b, 1)
+
+    def remove(self, value):
+        """Remove one occurrence of value. Raise ValueError if missing."""
+        b = bisect_left(self.maxes, value)
+        if b == len(self.blocks):
+            raise ValueError(f"{value!r} not in list")
+        block = self.blocks[b]
+        i = bisect_left(block, value)
+        if block[i] != value:
+            raise ValueError(f"{value!r} not in list")
+
+        del block[i]
+        self.size -= 1
+        if not block:
+            del self.blocks[b]
+            del self.maxes[b]
+            self.index = None
+            return
+        self.maxes[b] = block[-1]
+        if len(block) < self.load // 2 and len(self.blocks) > 1:
+            self._merge(b)
+        else:
+            self._resize(b, -1)
+
+    # ─── queries ───────────────────────────────────────────────────
+    def bisect_left(self, value):
+        """Global index of first element >= value."""
+        b = bisect_left(self.maxes, value)
+        if b == len(self.blocks):
+            return self.size
+        return self._offset(b) + bisect_left(self.blocks[b], value)
+
+    def bisect_right(self, value):
+        """Global index of first element > value."""
+        b = bisect_right(self.maxes, value)
+        if b == len(self.blocks):
+            return self.size
+        return self._offset(b) + bisect_right(self.blocks[b], value)
+
+    def find_first(self, target):
+        """Leftmost index of target, or -1."""
+        b = bisect_left(self.maxes, target)
+        if b == len(self.blocks):
+            return -1
+        block = self.blocks[b]              # maxes[b] >= target, so i < len(block)
+        i = bisect_left(block, target)
+        return self._offset(b) + i if block[i] == target else -1
+
+    def find_last(self, target):
+        """Rightmost index of target, or -1."""
+        b = bisect_right(self.maxes, target)
+        if b < len(self.blocks):
+            block = self.blocks[b]
+            j = bisect_right(block, target)
+            if j and block[j - 1] == target:
+                return self._offset(b) + j - 1
+        if b and self.maxes[b - 1] == target:   # last copy ends block b - 1
+            return self._offset(b) - 1
+        return -1
+
+    def count(self, lo, hi):
+        """Number of elements with lo <= x <= hi."""
+        return max(0, self.bisect_right(hi) - self.bisect_left(lo))
+
+    def kth(self, k):
+        """k-th smallest element (0-indexed)."""
+        if not 0 <= k < self.size:
+            raise IndexError("kth index out of range")
+        # Fenwick descent: largest prefix of blocks holding <= k items
+        tree, b = self._index(), 0
+        step = 1 << (len(tree) - 1).bit_length()
+        while step:
+            if b + step < len(tree) and tree[b + step] <= k:
+                b += step
+                k -= tree[b]
+            step >>= 1
+        return self.blocks[b][k]
@@ -2,6 +2,13 @@
 Classic Binary Search — Template
 """
 
+from bisect import bisect_left
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; batch search falls back to bisect
+    np = None
+
 
 def binary_search(arr, target):
     """Find target in sorted array. Return index or -1."""
@@ -35,3 +42,71 @@ def search_insert_position(arr, target):
             right = mid - 1
 
     return left  # insertion point
+
+
+def adaptive_search(arr, target):
+    """
+    Interpolation search with a bisection fallback. Numeric keys only.
+    Uniform keys: ~log log N probes. Skewed keys: any interpolation probe
+    that fails to halve the range is followed by a plain mid probe, so the
+    worst case stays O(log N). Return (index or -1, probes).
+    """
+    left, right = 0, len(arr) - 1
+    probes = 0
+    interpolate = True
+
+    while left <= right and arr[left] <= target <= arr[right]:
+        size = right - left
+        if interpolate and arr[right] != arr[left]:
+            mid = left + int((target - arr[left]) * size // (arr[right] - arr[left]))
+            mid = min(max(mid, left), right)   # float rounding can't escape range
+        else:
+            mid = left + size // 2
+        probes += 1
+
+        if arr[mid] == target:
+            return mid, probes
+        elif arr[mid] < target:
+            left = mid + 1
+        else:
+            right = mid - 1
+
+        # Fall back to bisection for one step if this probe didn't halve the range
+        interpolate = not interpolate or right - left <= size // 2
+
+    return -1, probes
+
+
+def search_many(arr, targets, insertion=False):
+    """
+    Answer a whole batch of targets against one sorted array.
+    Returns index or -1 per target (like binary_search), or the
+    insertion point when insertion=True (like search_insert_position).
+    With NumPy installed every input (list, array.array, ndarray) goes
+    through one vectorized searchsorted call; otherwise bisect per target.
+    """
+    if np is not None:
+        # list in → list out; ndarray in → ndarray out
+        as_list = not isinstance(arr, np.ndarray) and not isinstance(targets, np.ndarray)
+        arr = np.asarray(arr)       # array.array: zero-copy via the buffer protocol
+        targets = np.asarray(targets if hasattr(targets, "__len__") else list(targets))
+        idx = np.searchsorted(arr, targets, side="left")
+        if not insertion:
+            if len(arr) == 0:
+                idx = np.full(idx.shape, -1, dtype=np.intp)
+            else:
+                found = arr[np.minimum(idx, len(arr) - 1)] == targets
+                idx = np.where(found & (idx < len(arr)), idx, -1)
+        return idx.tolist() if as_list else idx
+
+    n = len(arr)
+    result = []
+    for target in targets:
+        i = bisect_left(arr, target)
+        if insertion or (i < n and arr[i] == target):
+            result.append(i)
+        else:
+            result.append(-1)
+
+    return result
+
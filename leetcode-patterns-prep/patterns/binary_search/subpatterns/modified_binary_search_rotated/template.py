@@ -2,6 +2,8 @@
 Modified Binary Search (Rotated / Special Arrays) — Template
 """
 
+from bisect import bisect_left
+
 
 def search_rotated(arr, target):
     """Search target in a rotated sorted array (no duplicates)."""
@@ -57,3 +59,56 @@ def find_peak_element(arr):
             right = mid          # peak is at mid or to the left
 
     return left  # index of peak
+
+
+def find_rotation_pivot(arr, allow_duplicates=False):
+    """
+    Index where the original sorted order starts (index of the minimum).
+    With duplicates the worst case degrades to O(N), e.g. [1, 1, 1, 1].
+    """
+    left, right = 0, len(arr) - 1
+
+    while left < right:
+        mid = left + (right - left) // 2
+
+        if arr[mid] > arr[right]:
+            left = mid + 1
+        elif arr[mid] < arr[right] or not allow_duplicates:
+            right = mid
+        elif arr[right - 1] > arr[right]:
+            return right          # arr[right] is the drop point
+        else:
+            right -= 1            # can't tell which side; shrink by one
+
+    return left
+
+
+class RotatedSortedIndex:
+    """
+    Find the pivot once, then every query is a plain bisect on one of the
+    two sorted runs arr[pivot:] and arr[:pivot] (no slicing, no copies).
+    """
+
+    def __init__(self, arr, allow_duplicates=False):
+        self.arr = arr
+        self.pivot = find_rotation_pivot(arr, allow_duplicates) if len(arr) else 0
+
+    def find_min(self):
+        return self.arr[self.pivot]
+
+    def search(self, target):
+        """Index of target or -1 (same contract as search_rotated)."""
+        arr, pivot, n = self.arr, self.pivot, len(self.arr)
+        if n == 0:
+            return -1
+
+        if target <= arr[-1]:
+            lo, hi = pivot, n     # target can only live in the run after pivot
+        else:
+            lo, hi = 0, pivot
+
+        i = bisect_left(arr, target, lo, hi)
+        return i if i < hi and arr[i] == target else -1
+
+    def search_many(self, targets):
+        return [self.search(target) for target in targets]
@@ -3,6 +3,15 @@ Binary Search — Master Template
 Copy-paste friendly. Three variants for different problem types.
 """
 
+import time
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; batch search falls back to bisect
+    np = None
+
 
 # ─── CLASSIC BINARY SEARCH ─────────────────────────────────────────
 def binary_search_classic(arr, target):
@@ -25,6 +34,39 @@ def binary_search_classic(arr, target):
     return -1
 
 
+def search_many(arr, targets, insertion=False):
+    """
+    Use when: many targets against the same sorted array.
+    Key: one vectorized searchsorted when NumPy is installed (lists and
+    array.array included), else one C-level bisect per target.
+    Returns index or -1 per target, or insertion points if insertion=True.
+    """
+    if np is not None:
+        # list in → list out; ndarray in → ndarray out
+        as_list = not isinstance(arr, np.ndarray) and not isinstance(targets, np.ndarray)
+        arr = np.asarray(arr)       # array.array: zero-copy via the buffer protocol
+        targets = np.asarray(targets if hasattr(targets, "__len__") else list(targets))
+        idx = np.searchsorted(arr, targets, side="left")
+        if not insertion:
+            if len(arr) == 0:
+                idx = np.full(idx.shape, -1, dtype=np.intp)
+            else:
+                found = arr[np.minimum(idx, len(arr) - 1)] == targets
+                idx = np.where(found & (idx < len(arr)), idx, -1)
+        return idx.tolist() if as_list else idx
+
+    n = len(arr)
+    result = []
+    for target in targets:
+        i = bisect_left(arr, target)
+        if insertion or (i < n and arr[i] == target):
+            result.append(i)
+        else:
+            result.append(-1)
+
+    return result
+
+
 # ─── BOUNDARY BINARY SEARCH (FIRST TRUE) ──────────────────────────
 def first_true(arr, condition):
     """
@@ -59,3 +101,38 @@ def binary_search_on_answer(lo, hi, check):
             lo = mid + 1    # mid doesn't work, try bigger
 
     return lo  # lo == hi == answer
+
+
+def binary_search_on_answer_parallel(lo, hi, check, k=4, executor=None):
+    """
+    Use when: check() is expensive (I/O, big scans) and safe to run concurrently.
+    Key: probe k points per round in parallel -> range shrinks by k+1, not 2.
+    Same contract as binary_search_on_answer. Returns (answer, stats).
+    Pass a ProcessPoolExecutor for CPU-bound, picklable checks.
+    """
+    stats = {"rounds": 0, "checks": 0, "wall_time": 0.0}
+    start = time.perf_counter()
+    own_pool = executor is None
+    pool = ThreadPoolExecutor(max_workers=k) if own_pool else executor
+
+    try:
+        while lo < hi:
+            # k evenly spaced probes inside [lo, hi - 1]
+            probes = sorted({lo + (hi - lo) * j // (k + 1) for j in range(1, k + 1)})
+            results = list(pool.map(check, probes))
+            stats["rounds"] += 1
+            stats["checks"] += len(probes)
+
+            new_lo = lo
+            for probe, ok in zip(probes, results):
+                if ok:
+                    hi = probe      # first True probe bounds the answer
+                    break
+                new_lo = probe + 1  # every False probe pushes lo past it
+            lo = new_lo
+    finally:
+        if own_pool:
+            pool.shutdown()
+
+    stats["wall_time"] = time.perf_counter() - start
+    return lo, stats
@@ -2,6 +2,16 @@
 Fixed-Size Sliding Window — Template
 """
 
+import random
+from collections import deque
+from itertools import accumulate
+from operator import sub
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; only the *_np helpers need it
+    np = None
+
 
 def max_sum_subarray_of_size_k(arr, k):
     """Find max sum of any contiguous subarray of size k."""
@@ -31,3 +41,315 @@ def averages_of_subarrays(arr, k):
         result.append(window_sum / k)
 
     return result
+
+
+def _block_window_sums(blocks, out):
+    """
+    blocks: (B, k) view of the data cut into blocks of k. Fills out (B-1, k)
+    with the sums of the windows starting in blocks 0..B-2. With P the
+    block-local running sums and T the block totals, the window at offset r
+    of block b is T[b] - P[b, r-1] + P[b+1, r-1]: every term sums at most k
+    elements, so the error depends on k, not on the stream length.
+    """
+    prefix = np.cumsum(blocks, axis=1, dtype=out.dtype)
+    total = prefix[:-1, -1:]
+    out[:, :1] = total
+    np.subtract(prefix[1:, :-1], prefix[:-1, :-1], out=out[:, 1:])
+    out[:, 1:] += total
+
+
+def window_sums_np(arr, k, stable=False):
+    """
+    All k-window sums as an ndarray, no Python loop.
+    stable=False: one cumsum, sums[i] = prefix[i + k] - prefix[i]. Fastest,
+        but rounding error grows with the position in the array (prefix
+        gets huge on long float streams).
+    stable=True: block-restarted cumsums (see _block_window_sums); error
+        depends only on k. Float input only. Costs about 1.2-1.5x the
+        stable=False path (two extra passes over the data).
+    Integer input is exact either way and always takes the fast path.
+    """
+    arr = np.asarray(arr)
+    n = len(arr)
+    if n < k:
+        return arr[:0]
+
+    if not stable or arr.dtype.kind in "iub":
+        prefix = np.empty(n + 1, dtype=np.cumsum(arr[:1]).dtype)
+        prefix[0] = 0
+        np.cumsum(arr, out=prefix[1:])
+        return prefix[k:] - prefix[:-k]    # new array: no overlapping in-place op
+
+    out = np.empty(n - k + 1, dtype=np.result_type(arr, np.float64))
+    full = n // k
+    body = (full - 1) * k if full >= 2 else 0     # windows inside full blocks
+    if body:
+        _block_window_sums(arr[:full * k].reshape(full, k),
+                           out[:body].reshape(full - 1, k))
+
+    # Last < 2k windows: zero-pad the short tail into whole blocks
+    tail = arr[body:]
+    padded_blocks = -(-len(tail) // k) + 1
+    padded = np.zeros(padded_blocks * k, dtype=out.dtype)
+    padded[:len(tail)] = tail
+    tail_sums = np.empty((padded_blocks - 1, k), dtype=out.dtype)
+    _block_window_sums(padded.reshape(padded_blocks, k), tail_sums)
+    out[body:] = tail_sums.ravel()[:len(out) - body]
+    return out
+
+
+def averages_of_subarrays_np(arr, k, stable=False):
+    """Vectorized averages_of_subarrays. Returns an ndarray."""
+    sums = window_sums_np(arr, k, stable)
+    if sums.dtype.kind == "f":
+        sums /= k                      # reuse the buffer, no extra copy
+        return sums
+    return sums / k
+
+
+def max_sum_subarray_of_size_k_np(arr, k):
+    """Vectorized max_sum_subarray_of_size_k (same -1 for short input)."""
+    if len(arr) < k:
+        return -1
+    return window_sums_np(arr, k).max().item()
+
+
+class PrefixWindows:
+    """
+    One prefix-sum pass, then ANY window size k is answered without
+    touching arr again: sum of arr[i:i+k] = prefix[i + k] - prefix[i].
+    Uses NumPy when installed, else C-level map/accumulate over lists.
+    """
+
+    def __init__(self, arr):
+        self.n = len(arr)
+        if np is not None:
+            self.prefix = np.concatenate(([0], np.cumsum(arr)))
+        else:
+            self.prefix = list(accumulate(arr, initial=0))
+
+    def sums(self, k):
+        prefix = self.prefix
+        if np is not None:
+            return prefix[k:] - prefix[:-k]
+        return list(map(sub, prefix[k:], prefix))
+
+    def max_sum(self, k):
+        """Same contract as max_sum_subarray_of_size_k (-1 if too short)."""
+        if self.n < k:
+            return -1
+        sums = self.sums(k)
+        return sums.max().item() if np is not None else max(sums)
+
+    def best_window(self, k):
+        """(start, window_sum) of the leftmost max-sum window, or None."""
+        if self.n < k:
+            return None
+        sums = self.sums(k)
+        if np is not None:
+            start = int(sums.argmax())
+            return start, sums[start].item()
+        start = max(range(len(sums)), key=sums.__getitem__)
+        return start, sums[start]
+
+    def averages(self, k):
+        """Same values as averages_of_subarrays (list, or ndarray with NumPy)."""
+        if self.n < k:
+            return []
+        if np is not None:
+            return self.sums(k) / k
+        return [window_sum / k for window_sum in self.sums(k)]
+
+
+def answer_many_k(arr, ks, query="max_sum"):
+    """
+    Answer a query for many window sizes in one pass over arr.
+    query: "max_sum" | "best_window" | "averages". Returns {k: answer}.
+    """
+    windows = PrefixWindows(arr)
+    method = getattr(windows, query)
+    return {k: method(k) for k in ks}
+
+
+def stream_fixed_window(iterable, k):
+    """
+    Same sliding step over ANY iterable (file, socket reader, generator).
+    Keeps only a k-slot ring buffer -> O(k) memory for any stream length.
+    Yields (window_sum, average, best_sum_so_far) once per full window.
+    """
+    ring = [0] * k
+    window_sum = 0
+    best = None
+
+    for i, value in enumerate(iterable):
+        slot = i % k
+        window_sum += value
+        window_sum -= ring[slot]      # element leaving (0 until first window fills)
+        ring[slot] = value
+
+        if i >= k - 1:
+            if best is None or window_sum > best:
+                best = window_sum
+            yield window_sum, window_sum / k, best
+
+
+def window_extrema(iterable, k, largest=True):
+    """
+    Monotonic deque: yields max (or min) of each k-window in O(N) total.
+    Works on lists and on streams; memory is O(k).
+    Deque holds (index, value) with values strictly decreasing (increasing
+    for min), so the front is always the current window's answer.
+    """
+    dq = deque()
+
+    for i, value in enumerate(iterable):
+        # Pop everything the new value dominates — it can never be the answer again
+        if largest:
+            while dq and dq[-1][1] <= value:
+                dq.pop()
+        else:
+            while dq and dq[-1][1] >= value:
+                dq.pop()
+        dq.append((i, value))
+
+        if dq[0][0] <= i - k:
+            dq.popleft()              # front slid out of the window
+
+        if i >= k - 1:
+            yield dq[0][1]
+
+
+def window_max(arr, k):
+    """Max of every contiguous window of size k."""
+    return list(window_extrema(arr, k, largest=True))
+
+
+def window_min(arr, k):
+    """Min of every contiguous window of size k."""
+    return list(window_extrema(arr, k, largest=False))
+
+
+def window_extrema_np(arr, k, largest=True):
+    """
+    Batched NumPy version (van Herk / Gil-Werman): split into blocks of k,
+    take running max forward and backward inside each block; window i is
+    max(suffix of its block, prefix of the next block). O(N), no Python loop.
+    """
+    arr = np.asarray(arr)
+    n = len(arr)
+    if n < k:
+        return arr[:0]
+
+    op = np.maximum if largest else np.minimum
+    kind = arr.dtype.kind
+    if kind == "f":
+        fill = -np.inf if largest else np.inf
+    elif kind == "b":
+        fill = not largest
+    elif kind in "iu":
+        info = np.iinfo(arr.dtype)
+        fill = info.min if largest else info.max
+    else:
+        raise TypeError(f"window_extrema_np needs a bool, int or float array, got {arr.dtype}")
+
+    blocks = -(-n // k) + 1
+    padded = np.full(blocks * k, fill, dtype=arr.dtype)
+    padded[:n] = arr
+    padded = padded.reshape(blocks, k)
+    prefix = op.accumulate(padded, axis=1)
+    result = op.accumulate(padded[:, ::-1], axis=1)[:-1, ::-1]
+    op(result[:, 1:], prefix[1:, :-1], out=result[:, 1:])
+    return result.ravel()[:n - k + 1]
+
+
+class RollingHash:
+    """
+    Rabin–Karp hash of every length-m window — the fixed_window step with a
+    hash instead of a sum: remove the char leaving on the left, add the char
+    entering on the right, O(1) per slide. Works on str or bytes.
+    """
+
+    MOD = (1 << 61) - 1   # Mersenne prime: collisions ~ 1 / 2^61 per window
+
+    def __init__(self, m, base=None):
+        self.m = m
+        self.base = base or random.randrange(256, self.MOD - 1)
+        self.high = pow(self.base, m - 1, self.MOD)   # weight of the leaving char
+
+    @staticmethod
+    def _codes(s):
+        return s if isinstance(s, (bytes, bytearray)) else [ord(c) for c in s]
+
+    def hash(self, s):
+        h = 0
+        for c in self._codes(s):
+            h = (h * self.base + c) % self.MOD
+        return h
+
+    def rolling(self, text):
+        """Yield (start, hash) for every length-m window of text."""
+        m, base, high, mod = self.m, self.base, self.high, self.MOD
+        codes = self._codes(text)
+        if len(codes) < m:
+            return
+
+        h = 0
+        for c in codes[:m]:                  # build first window
+            h = (h * base + c) % mod
+        yield 0, h
+
+        for right in range(m, len(codes)):
+            h = (h - codes[right - m] * high) % mod   # remove leaving char
+            h = (h * base + codes[right]) % mod       # add entering char
+            yield right - m + 1, h
+
+
+class RollingHashMatcher:
+    """
+    Match any number of same-length patterns in ONE rolling-hash pass.
+    Hash hits are verified by a real comparison, so collisions never
+    produce false matches. Patterns and text must be the same type.
+    """
+
+    def __init__(self, patterns, base=None):
+        patterns = list(patterns)
+        m = len(patterns[0])
+        if any(len(p) != m for p in patterns):
+            raise ValueError("all patterns must have the same length")
+        self.hasher = RollingHash(m, base)
+        self.table = {}   # hash → patterns with that hash
+        for p in patterns:
+            self.table.setdefault(self.hasher.hash(p), []).append(p)
+
+    def find_all(self, text):
+        """All (start, pattern) matches, in text order."""
+        m, table = self.hasher.m, self.table
+        for start, h in self.hasher.rolling(text):
+            for p in table.get(h, ()):
+                if text[start:start + m] == p:
+                    yield start, p
+
+
+def repeated_substrings(text, m):
+    """Every length-m substring occurring more than once (Repeated DNA style)."""
+    first_seen = {}     # hash → starts of distinct substrings with that hash
+    repeated = []
+    reported = set()
+
+    for start, h in RollingHash(m).rolling(text):
+        bucket = first_seen.get(h)
+        if bucket is None:
+            first_seen[h] = [start]                  # new hash: no slice needed
+            continue
+
+        window = text[start:start + m]               # only slice to verify
+        for prev in bucket:
+            if text[prev:prev + m] == window:
+                if prev not in reported:
+                    reported.add(prev)
+                    repeated.append(window)
+                break
+        else:
+            bucket.append(start)                     # genuine hash collision
+
+    return repeated
@@ -0,0 +1,104 @@
+"""
+Minimum Window Pattern — Template
+"""
+
+import re
+from array import array
+from collections import deque
+
+
+def minimum_window(s, t):
+    """Smallest substring of s containing every char of t (with counts)."""
+    from collections import Counter
+
+    need = Counter(t)
+    missing = len(t)
+    left = 0
+    best = (float("inf"), 0, 0)  # (length, start, end)
+
+    for right in range(len(s)):
+        if need[s[right]] > 0:
+            missing -= 1
+        need[s[right]] -= 1
+
+        while missing == 0:
+            if right - left + 1 < best[0]:
+                best = (right - left + 1, left, right)
+
+            need[s[left]] += 1
+            if need[s[left]] > 0:
+                missing += 1
+            left += 1
+
+    return s[best[1]:best[2] + 1] if best[0] != float("inf") else ""
+
+
+class MinimumWindowMatcher:
+    """
+    Preprocess t ONCE, then run minimum_window over many (huge) haystacks.
+    - Prefilter: a lazy C-level regex scan yields only positions whose char
+      is in t; every other char is skipped entirely.
+    - Memory: only the (position, slot) pairs inside the current window are
+      kept, never a list over the whole haystack.
+    - Counts live in a compact int array indexed by slot id, not a Counter.
+    - Works on str or bytes (t and the haystack must be the same type).
+    """
+
+    def __init__(self, t):
+        self.t = t
+        self.slot = {}                    # char (or byte value) → slot id
+        required = []
+        for unit in t:
+            if unit not in self.slot:
+                self.slot[unit] = len(required)
+                required.append(0)
+            required[self.slot[unit]] += 1
+        self.required = array("q", required)
+
+        if isinstance(t, (bytes, bytearray)):
+            chars = b"".join(re.escape(bytes([b])) for b in self.slot)
+            self.relevant = re.compile(b"[" + chars + b"]") if t else None
+        else:
+            chars = "".join(re.escape(c) for c in self.slot)
+            self.relevant = re.compile("[" + chars + "]") if t else None
+
+    def span(self, s):
+        """(start, end) of the smallest valid window (end exclusive), or None."""
+        if not self.t:
+            return None
+        if isinstance(s, (bytes, bytearray, memoryview)) != isinstance(self.t, (bytes, bytearray)):
+            raise TypeError("haystack and t must both be str or both be bytes")
+
+        slot = self.slot
+        need = array("q", self.required)  # per-haystack copy of the counts
+        missing = len(self.t)
+        window = deque()                  # (position, slot) of relevant chars
+        best = None
+
+        for match in self.relevant.finditer(s):
+            # EXPAND
+            right = match.start()
+            k = slot[s[right]]
+            window.append((right, k))
+            if need[k] > 0:
+                missing -= 1
+            need[k] -= 1
+
+            # SHRINK — window spans window[0] .. right in s
+            while missing == 0:
+                left, k = window.popleft()
+                if best is None or right - left + 1 < best[1] - best[0]:
+                    best = (left, right + 1)
+
+                need[k] += 1
+                if need[k] > 0:
+                    missing += 1
+
+        return best
+
+    def search(self, s):
+        """Same result as minimum_window(s, t); empty str/bytes if none."""
+        found = self.span(s)
+        if found is None:
+            return s[:0]
+        return s[found[0]:found[1]]
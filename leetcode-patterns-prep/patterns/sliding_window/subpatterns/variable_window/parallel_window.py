@@ -0,0 +1,106 @@
+"""
+Variable-Size Sliding Window — Parallel Chunked Driver
+Runs subarray_sum_at_most_k over a memory-mapped binary array file on all cores.
+
+File format: raw native-endian array('q') bytes (see write_array_file).
+Assumes non-negative numbers, same as the serial template.
+
+Why chunking is exact here:
+- Pass 1 (parallel): total of every chunk.
+- Pass 2 (parallel): each worker owns a range of RIGHT endpoints
+  [start, stop). It rebuilds the window the serial pass would have at
+  start - 1 (the leftmost valid left): first it steps back over WHOLE
+  earlier chunks using their totals, then scans element by element only
+  inside the one chunk where the window stops fitting. That is the
+  "overlap", and it costs O(chunk) per worker however long the window is.
+- The left pointer may read before `start` — the mmap is shared, so no copy.
+  Left positions of different workers never overlap, so total work is O(N).
+- Answer = max over chunks, identical to the serial pass. That needs exact
+  sums (the chunk totals are added in a different order than the serial
+  add/subtract), so only integer typecodes are accepted.
+"""
+
+import mmap
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+INT_TYPECODES = "bBhHiIlLqQ"
+
+
+def write_array_file(path, values, typecode="q"):
+    """Dump values as raw binary so workers can mmap them."""
+    with open(path, "wb") as f:
+        array(typecode, values).tofile(f)
+
+
+def _open_view(path, typecode):
+    f = open(path, "rb")
+    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return f, mm, memoryview(mm).cast(typecode)
+
+
+def _chunk_total(path, typecode, start, stop):
+    f, mm, arr = _open_view(path, typecode)
+    try:
+        return sum(arr[start:stop])
+    finally:
+        arr.release()
+        mm.close()
+        f.close()
+
+
+def _chunk_longest(path, typecode, bounds, totals, chunk, k):
+    """Serial subarray_sum_at_most_k restricted to right in this chunk."""
+    start, stop = bounds[chunk], bounds[chunk + 1]
+    f, mm, arr = _open_view(path, typecode)
+    try:
+        # Rebuild the window ending at start - 1. Whole chunks first...
+        window_sum = 0
+        c = chunk - 1
+        while c >= 0 and window_sum + totals[c] <= k:
+            window_sum += totals[c]
+            c -= 1
+        # ...then element by element inside the chunk that doesn't fit whole
+        left = bounds[c + 1]
+        while left > 0 and window_sum + arr[left - 1] <= k:
+            left -= 1
+            window_sum += arr[left]
+
+        best = 0
+        for right in range(start, stop):
+            window_sum += arr[right]
+
+            while window_sum > k:
+                window_sum -= arr[left]
+                left += 1
+
+            best = max(best, right - left + 1)
+
+        return best
+    finally:
+        arr.release()
+        mm.close()
+        f.close()
+
+
+def subarray_sum_at_most_k_parallel(path, k, typecode="q", workers=None, chunks=None):
+    """Longest subarray with sum <= k over the array stored at path."""
+    if typecode not in INT_TYPECODES:
+        raise ValueError(f"typecode must be an integer code ({INT_TYPECODES}), got {typecode!r}")
+    n = os.path.getsize(path) // array(typecode).itemsize
+    if n == 0:
+        return 0
+
+    workers = workers or os.cpu_count() or 1
+    chunks = min(n, chunks or workers * 4)
+    bounds = [n * i // chunks for i in range(chunks + 1)]
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        totals = list(pool.map(_chunk_total, [path] * chunks, [typecode] * chunks,
+                               bounds[:-1], bounds[1:]))
+        futures = [
+            pool.submit(_chunk_longest, path, typecode, bounds, totals, i, k)
+            for i in range(chunks)
+        ]
+        return max(future.result() for future in futures)
@@ -26,6 +26,28 @@ def longest_substring_no_repeat(s):
     return best
 
 
+def longest_unique_bytes(data):
+    """
+    Same answer as longest_substring_no_repeat, for bytes / bytearray /
+    memoryview. Iterating bytes yields ints, so a fixed 256-slot last-seen
+    table replaces the dict, and left JUMPS past the previous occurrence
+    instead of shrinking one step at a time.
+    """
+    last = [-1] * 256   # byte value → last index seen
+    left = 0
+    best = 0
+
+    for right, byte in enumerate(memoryview(data).cast("B")):
+        if last[byte] >= left:
+            left = last[byte] + 1     # jump straight past the duplicate
+        last[byte] = right
+
+        if right - left + 1 > best:
+            best = right - left + 1
+
+    return best
+
+
 def subarray_sum_at_most_k(arr, k):
     """Longest subarray with sum <= k (all positive numbers)."""
     left = 0
@@ -0,0 +1,331 @@
+"""
+Sliding Window — Reusable Core
+One EXPAND / SHRINK loop, pluggable O(1) aggregators for the window state.
+
+    w = SlidingWindow(SumAgg(), MaxAgg())
+    for total, biggest in w.fixed(stream, k): ...
+
+    w = SlidingWindow(CountDistinctAgg())
+    w.longest(s, invalid=lambda w: w.aggregators[0].result() > 2)
+
+    for stats in TimeWindow(size=60, step=10, lateness=5).run(events): ...
+
+    for p99 in sliding_quantile(latencies, k=1000, q=0.99): ...
+
+Aggregator contract: add(x) when x enters, remove(x) when x leaves (always
+the OLDEST element — windows are FIFO), result() for the current value.
+"""
+
+import heapq
+from collections import deque, namedtuple
+
+
+# ─── AGGREGATORS ──────────────────────────────────────────────────
+class SumAgg:
+    __slots__ = ("total",)
+
+    def __init__(self):
+        self.total = 0
+
+    def add(self, x):
+        self.total += x
+
+    def remove(self, x):
+        self.total -= x
+
+    def result(self):
+        return self.total
+
+
+class XorAgg:
+    __slots__ = ("acc",)
+
+    def __init__(self):
+        self.acc = 0
+
+    def add(self, x):
+        self.acc ^= x
+
+    def remove(self, x):
+        self.acc ^= x          # xor is its own inverse
+
+    def result(self):
+        return self.acc
+
+
+class FrequencyAgg:
+    """Value → count inside the window (keys with count 0 are dropped)."""
+    __slots__ = ("counts",)
+
+    def __init__(self):
+        self.counts = {}
+
+    def add(self, x):
+        self.counts[x] = self.counts.get(x, 0) + 1
+
+    def remove(self, x):
+        self.counts[x] -= 1
+        if self.counts[x] == 0:
+            del self.counts[x]
+
+    def result(self):
+        return self.counts
+
+
+class CountDistinctAgg(FrequencyAgg):
+    __slots__ = ()
+
+    def result(self):
+        return len(self.counts)
+
+
+class MaxAgg:
+    """Monotonic deque of (arrival, value); front is the window max."""
+    __slots__ = ("dq", "added", "removed")
+
+    def __init__(self):
+        self.dq = deque()
+        self.added = 0
+        self.removed = 0
+
+    def _dominates(self, new, old):
+        return new >= old
+
+    def add(self, x):
+        dq = self.dq
+        while dq and self._dominates(x, dq[-1][1]):
+            dq.pop()
+        dq.append((self.added, x))
+        self.added += 1
+
+    def remove(self, x):
+        # FIFO removal: the leaving element is arrival number `removed`
+        if self.dq[0][0] == self.removed:
+            self.dq.popleft()
+        self.removed += 1
+
+    def result(self):
+        return self.dq[0][1] if self.dq else None
+
+
+class MinAgg(MaxAgg):
+    __slots__ = ()
+
+    def _dominates(self, new, old):
+        return new <= old
+
+
+class QuantileAgg:
+    """
+    q-quantile of the window (q=0.5 → median), linear interpolation like
+    numpy.quantile. Two heaps with lazy deletion:
+    - lower (max-heap, negated) holds the floor(q*(n-1)) + 1 smallest values
+    - upper (min-heap) holds the rest
+    remove(x) only records x in `delayed`; it is popped once it reaches a top.
+    add/remove: O(log k) amortized.
+    """
+    __slots__ = ("q", "lower", "upper", "delayed", "lower_size", "upper_size")
+
+    def __init__(self, q=0.5):
+        self.q = q
+        self.lower = []
+        self.upper = []
+        self.delayed = {}     # value → copies removed but still in a heap
+        self.lower_size = 0   # live (non-delayed) counts
+        self.upper_size = 0
+
+    def _prune(self, heap, sign):
+        """Pop delayed values off the top of heap (sign=-1 for lower)."""
+        delayed = self.delayed
+        while heap and delayed.get(sign * heap[0], 0):
+            value = sign * heapq.heappop(heap)
+            delayed[value] -= 1
+            if delayed[value] == 0:
+                del delayed[value]
+
+    def _rebalance(self):
+        n = self.lower_size + self.upper_size
+        target = int(self.q * (n - 1)) + 1 if n else 0
+
+        while self.lower_size > target:       # lower top → upper
+            heapq.heappush(self.upper, -heapq.heappop(self.lower))
+            self.lower_size -= 1
+            self.upper_size += 1
+            self._prune(self.lower, -1)
+        while self.lower_size < target:       # upper top → lower
+            heapq.heappush(self.lower, -heapq.heappop(self.upper))
+            self.upper_size -= 1
+            self.lower_size += 1
+            self._prune(self.upper, 1)
+
+    def add(self, x):
+        if self.lower and x <= -self.lower[0]:
+            heapq.heappush(self.lower, -x)
+            self.lower_size += 1
+        else:
+            heapq.heappush(self.upper, x)
+            self.upper_size += 1
+        self._rebalance()
+
+    def remove(self, x):
+        self.delayed[x] = self.delayed.get(x, 0) + 1
+        if self.lower and x <= -self.lower[0]:
+            self.lower_size -= 1
+            self._prune(self.lower, -1)
+        else:
+            self.upper_size -= 1
+            self._prune(self.upper, 1)
+        self._rebalance()
+
+    def result(self):
+        n = self.lower_size + self.upper_size
+        if n == 0:
+            return None
+        pos = self.q * (n - 1)
+        frac = pos - int(pos)
+        below = -self.lower[0]
+        if frac == 0:
+            return below
+        return below + frac * (self.upper[0] - below)
+
+
+# ─── WINDOW ───────────────────────────────────────────────────────
+class SlidingWindow:
+    """FIFO window that keeps every aggregator in sync on expand/shrink."""
+    __slots__ = ("items", "aggregators")
+
+    def __init__(self, *aggregators):
+        self.items = deque()
+        self.aggregators = aggregators
+
+    def __len__(self):
+        return len(self.items)
+
+    def expand(self, x):
+        self.items.append(x)
+        for agg in self.aggregators:
+            agg.add(x)
+
+    def shrink(self):
+        x = self.items.popleft()
+        for agg in self.aggregators:
+            agg.remove(x)
+        return x
+
+    def results(self):
+        return tuple(agg.result() for agg in self.aggregators)
+
+    def fixed(self, iterable, k):
+        """Fixed-size window: yields results() for every full k-window."""
+        for x in iterable:
+            self.expand(x)
+            if len(self.items) > k:
+                self.shrink()
+            if len(self.items) == k:
+                yield self.results()
+
+    def longest(self, iterable, invalid):
+        """Variable-size window: longest run where invalid(self) is False."""
+        best = 0
+        for x in iterable:
+            self.expand(x)                  # EXPAND
+            while self.items and invalid(self):
+                self.shrink()               # SHRINK
+            best = max(best, len(self.items))   # UPDATE
+        return best
+
+
+def sliding_quantile(iterable, k, q=0.5):
+    """q-quantile of every k-window; lists or streams, O(N log k)."""
+    for (value,) in SlidingWindow(QuantileAgg(q)).fixed(iterable, k):
+        yield value
+
+
+def sliding_median(nums, k):
+    """Sliding Window Median (LeetCode 480)."""
+    return list(sliding_quantile(nums, k, 0.5))
+
+
+# ─── TIME-KEYED WINDOW ────────────────────────────────────────────
+WindowStats = namedtuple("WindowStats", "start end count total avg max")
+
+
+class TimeWindow:
+    """
+    Windows by DURATION over (timestamp, value) events, not by element count.
+    - Windows are [j*step, j*step + size). step == size → tumbling,
+      step < size → hopping (overlapping).
+    - Out-of-order arrival: events wait in a small heap until
+      max_timestamp_seen - lateness passes them, then enter in time order.
+      Events older than what was already released are dropped (counted).
+    - Memory: events inside the current window + the lateness buffer.
+    Empty windows are skipped.
+    """
+    __slots__ = ("size", "step", "lateness", "window", "times", "dropped")
+
+    def __init__(self, size, step=None, lateness=0):
+        self.size = size
+        self.step = step or size
+        self.lateness = lateness
+        self.window = SlidingWindow(SumAgg(), MaxAgg())
+        self.times = deque()      # timestamps parallel to window.items
+        self.dropped = 0
+
+    def _emit(self, j):
+        """Evict events before window j starts; stats if anything is left."""
+        start = j * self.step
+        while self.times and self.times[0] < start:
+            self.times.popleft()
+            self.window.shrink()
+        if not self.times:
+            return None
+        count = len(self.times)
+        total, biggest = self.window.results()
+        return WindowStats(start, start + self.size, count, total, total / count, biggest)
+
+    def _first_window(self, t):
+        """Index of the earliest window that contains timestamp t."""
+        return (t - self.size) // self.step + 1
+
+    def run(self, events):
+        pending = []              # heap of (timestamp, arrival, value)
+        released = None           # newest timestamp handed to the window
+        newest = None
+        j = None
+
+        def release(t, value):
+            nonlocal j
+            if j is None:
+                j = self._first_window(t)
+            # Close every window that ends at or before t
+            while j * self.step + self.size <= t:
+                stats = self._emit(j)
+                if stats:
+                    yield stats
+                j += 1
+                if not self.times:
+                    j = max(j, self._first_window(t))   # skip the empty gap
+            self.times.append(t)
+            self.window.expand(value)
+
+        for arrival, (t, value) in enumerate(events):
+            if released is not None and t < released:
+                self.dropped += 1     # later than the lateness bound allows
+                continue
+            heapq.heappush(pending, (t, arrival, value))
+            newest = t if newest is None else max(newest, t)
+
+            while pending and pending[0][0] <= newest - self.lateness:
+                t0, _, v0 = heapq.heappop(pending)
+                released = t0
+                yield from release(t0, v0)
+
+        while pending:                # end of stream: flush the buffer
+            t0, _, v0 = heapq.heappop(pending)
+            yield from release(t0, v0)
+
+        while self.times:             # and every window still holding events
+            stats = self._emit(j)
+            if stats:
+                yield stats
+            j += 1
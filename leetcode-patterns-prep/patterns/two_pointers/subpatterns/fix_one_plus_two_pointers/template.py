@@ -0,0 +1,212 @@
+"""
+Fix One + Two Pointers (3Sum Style) — Template
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import accumulate
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; only three_sum_fast needs it
+    np = None
+
+
+def three_sum(arr, target=0):
+    """All unique triplets summing to target."""
+    arr.sort()
+    result = []
+
+    for i in range(len(arr) - 2):
+        if i > 0 and arr[i] == arr[i - 1]:
+            continue  # skip duplicate fixed element
+
+        left, right = i + 1, len(arr) - 1
+
+        while left < right:
+            total = arr[i] + arr[left] + arr[right]
+
+            if total == target:
+                result.append([arr[i], arr[left], arr[right]])
+                left += 1
+                right -= 1
+                while left < right and arr[left] == arr[left - 1]:
+                    left += 1  # skip duplicates
+            elif total < target:
+                left += 1
+            else:
+                right -= 1
+
+    return result
+
+
+def three_sum_pruned(arr, target=0):
+    """
+    three_sum plus min/max bound pruning on the fixed element:
+    - smallest possible sum arr[i] + arr[i+1] + arr[i+2] > target → stop
+      (tighter than arr[i] * 3 > target; sorted, so it only grows)
+    - largest possible sum arr[i] + arr[-2] + arr[-1] < target → skip this i
+    """
+    arr.sort()
+    n = len(arr)
+    result = []
+
+    for i in range(n - 2):
+        if i > 0 and arr[i] == arr[i - 1]:
+            continue
+        if arr[i] + arr[i + 1] + arr[i + 2] > target:
+            break
+        if arr[i] + arr[n - 2] + arr[n - 1] < target:
+            continue
+
+        left, right = i + 1, n - 1
+
+        while left < right:
+            total = arr[i] + arr[left] + arr[right]
+
+            if total == target:
+                result.append([arr[i], arr[left], arr[right]])
+                left += 1
+                right -= 1
+                while left < right and arr[left] == arr[left - 1]:
+                    left += 1
+            elif total < target:
+                left += 1
+            else:
+                right -= 1
+
+    return result
+
+
+def _two_pointer_pairs(arr, start, target, count_only=False):
+    """
+    Two-pointer core: unique value pairs in arr[start:] summing to target.
+    count_only=True yields None per pair, so counting allocates nothing.
+    """
+    left, right = start, len(arr) - 1
+
+    while left < right:
+        total = arr[left] + arr[right]
+
+        if total == target:
+            yield None if count_only else (arr[left], arr[right])
+            left += 1
+            right -= 1
+            while left < right and arr[left] == arr[left - 1]:
+                left += 1
+        elif total < target:
+            left += 1
+        else:
+            right -= 1
+
+
+def k_sum(arr, k, target, count_only=False):
+    """
+    All unique k-tuples summing to target (k >= 2): fix one element per
+    level, recurse, and finish with the two-pointer core. Sorts once.
+    Every level skips duplicate fixed values and prunes with prefix sums:
+    - the k smallest sums from i on exceed target → break
+    - arr[i] + the k-1 largest values fall short   → skip this i
+    count_only=True returns just the number of tuples; no tuples or result
+    lists are built at any level.
+    """
+    if k < 2:
+        raise ValueError("k_sum needs k >= 2")
+    arr.sort()
+    n = len(arr)
+    prefix = list(accumulate(arr, initial=0))
+
+    def candidates(start, k, target):
+        """Fixed indices worth recursing on at this level."""
+        for i in range(start, n - k + 1):
+            if i > start and arr[i] == arr[i - 1]:
+                continue
+            if prefix[i + k] - prefix[i] > target:
+                break
+            if arr[i] + prefix[n] - prefix[n - k + 1] < target:
+                continue
+            yield i
+
+    def tuples(start, k, target):
+        if k == 2:
+            yield from _two_pointer_pairs(arr, start, target)
+            return
+        for i in candidates(start, k, target):
+            for rest in tuples(i + 1, k - 1, target - arr[i]):
+                yield (arr[i],) + rest
+
+    def count(start, k, target):
+        if k == 2:
+            return sum(1 for _ in _two_pointer_pairs(arr, start, target, count_only=True))
+        return sum(count(i + 1, k - 1, target - arr[i])
+                   for i in candidates(start, k, target))
+
+    if count_only:
+        return count(0, k, target)
+    return [list(t) for t in tuples(0, k, target)]
+
+
+def _three_sum_rows(arr, target, fixed):
+    """
+    Vectorized inner scan for each fixed index i: for every candidate
+    middle j, look up the needed third value with one searchsorted call.
+    Returns an (m, 3) array of triplets.
+    """
+    n = len(arr)
+    rows = []
+
+    for i in fixed:
+        rest = target - arr[i]
+        # Middle value can't exceed rest / 2 (third value must be >= it)
+        half = rest // 2 if arr.dtype.kind in "iu" else rest / 2
+        stop = int(np.searchsorted(arr, half, side="right"))
+        if stop <= i + 1:
+            continue
+        j = np.arange(i + 1, stop)
+        j = j[(j == i + 1) | (arr[j] != arr[j - 1])]     # unique middles
+        need = rest - arr[j]
+        hi = np.searchsorted(arr, need, side="right")
+        ok = (hi - 1 > j) & (arr[np.minimum(hi - 1, n - 1)] == need)
+        if ok.any():
+            block = np.empty((int(ok.sum()), 3), dtype=arr.dtype)
+            block[:, 0] = arr[i]
+            block[:, 1] = arr[j[ok]]
+            block[:, 2] = need[ok]
+            rows.append(block)
+
+    if not rows:
+        return np.empty((0, 3), dtype=arr.dtype)
+    return np.concatenate(rows)
+
+
+def three_sum_fast(arr, target=0, workers=1):
+    """
+    Same triplets as three_sum, as a compact (m, 3) ndarray (needs NumPy).
+    Bound pruning picks the useful fixed indices up front; the inner scan is
+    vectorized, and workers > 1 splits the fixed indices over a process pool.
+    """
+    if np is None:
+        raise ImportError("three_sum_fast requires NumPy")
+
+    arr = np.sort(np.asarray(arr))
+    n = len(arr)
+    if n < 3:
+        return np.empty((0, 3), dtype=arr.dtype)
+
+    i = np.arange(n - 2)
+    keep = (i == 0) | (arr[i] != arr[i - 1])               # unique fixed values
+    keep &= arr[i] + arr[i + 1] + arr[i + 2] <= target     # min bound
+    keep &= arr[i] + arr[n - 2] + arr[n - 1] >= target     # max bound
+    fixed = i[keep]
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(fixed) < 2 * workers:
+        return _three_sum_rows(arr, target, fixed)
+
+    # Interleave so every worker gets a mix of cheap (late) and costly (early) i
+    parts = [fixed[w::workers] for w in range(workers)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        blocks = list(pool.map(_three_sum_rows, [arr] * workers, [target] * workers, parts))
+
+    result = np.concatenate(blocks)
+    return result[np.lexsort((result[:, 1], result[:, 0]))]
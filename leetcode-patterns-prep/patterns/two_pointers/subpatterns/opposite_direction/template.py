@@ -2,6 +2,11 @@
 Opposite Direction Two Pointers — Template
 """
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; TwoSumIndex falls back to dicts
+    np = None
+
 
 def opposite_direction(arr, target):
     """
@@ -23,6 +28,58 @@ def opposite_direction(arr, target):
     return []
 
 
+class TwoSumIndex:
+    """
+    Preprocess one sorted array, then answer Two Sum II for many targets.
+    Matches the two-pointer answer exactly: the squeeze returns the SMALLEST
+    left index that has a partner, paired with the LAST index holding
+    target - arr[left]. Only distinct values <= target / 2 can be the left.
+    Returns 1-indexed [left, right] (LeetCode 167), or [] if no pair.
+    """
+
+    def __init__(self, numbers):
+        if np is not None:
+            arr = np.asarray(numbers)
+            self.values, self.first, counts = np.unique(
+                arr, return_index=True, return_counts=True)
+            self.last = self.first + counts - 1
+        else:
+            self.first_of = {}
+            self.last_of = {}
+            for i, x in enumerate(numbers):
+                self.first_of.setdefault(x, i)
+                self.last_of[x] = i
+            self.values = list(self.first_of)    # ascending (input is sorted)
+
+    def query(self, target):
+        if np is not None:
+            values = self.values
+            left = values[: np.searchsorted(values, target / 2, side="right")]
+            need = target - left
+            pos = np.minimum(np.searchsorted(values, need), len(values) - 1)
+            ok = (values[pos] == need) & (self.last[pos] > self.first[: len(left)])
+            if not ok.any():
+                return []
+            k = int(ok.argmax())
+            return [int(self.first[k]) + 1, int(self.last[pos[k]]) + 1]
+
+        for x in self.values:
+            if x > target / 2:
+                break
+            right = self.last_of.get(target - x)
+            if right is not None and right > self.first_of[x]:
+                return [self.first_of[x] + 1, right + 1]
+        return []
+
+    def query_many(self, targets):
+        return [self.query(target) for target in targets]
+
+
+def two_sum_many(numbers, targets):
+    """Two Sum II for every target against the same sorted numbers."""
+    return TwoSumIndex(numbers).query_many(targets)
+
+
 def is_palindrome(s):
     """
     String/array → check if it reads the same forwards and backwards.
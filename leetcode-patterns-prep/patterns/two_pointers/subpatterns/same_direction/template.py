@@ -2,6 +2,13 @@
 Same Direction Two Pointers (In-Place Modify) — Template
 """
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; *_buffer helpers fall back to the loops
+    np = None
+
+CHUNK = 1 << 20  # elements per vectorized block (bounds temporary memory)
+
 
 def remove_element(arr, val):
     """Remove all occurrences of val in-place. Return new length."""
@@ -28,3 +35,75 @@ def remove_duplicates_sorted(arr):
             write += 1
 
     return write
+
+
+# ─── BUFFER VERSIONS (array.array / NumPy / any writable buffer) ──
+def _as_view(buf):
+    """
+    Zero-copy writable 1-D ndarray over buf, or None if we must loop.
+    Raise ValueError rather than compact a hidden copy: reshape(-1) silently
+    copies non-C-contiguous arrays (Fortran order, transposes, strided views).
+    """
+    if np is None or isinstance(buf, list):
+        return None
+    view = buf if isinstance(buf, np.ndarray) else np.asarray(memoryview(buf))
+    if not view.flags.c_contiguous:
+        raise ValueError("buffer must be C-contiguous to compact in place")
+    if not view.flags.writeable:
+        raise ValueError("buffer is read-only")
+    return view.reshape(-1)
+
+
+def _compact(view, keep_mask):
+    """
+    Same write/read pointers, one block at a time: keep_mask(block, prev)
+    marks survivors, they are written at `write`. write <= read always,
+    and kept is a copy, so overwriting never clobbers unread data.
+    Extra memory: O(CHUNK), not O(N).
+    """
+    write = 0
+    prev = None              # last ORIGINAL element of the previous block
+    for read in range(0, len(view), CHUNK):
+        block = view[read:read + CHUNK]
+        kept = block[keep_mask(block, prev)]
+        prev = block[-1].item()
+        view[write:write + len(kept)] = kept
+        write += len(kept)
+    return write
+
+
+def remove_element_buffer(buf, val):
+    """remove_element on a buffer with vectorized masks. Return new length."""
+    view = _as_view(buf)
+    if view is None:
+        return remove_element(buf, val)
+    return _compact(view, lambda block, prev: block != val)
+
+
+def remove_duplicates_sorted_buffer(buf):
+    """remove_duplicates_sorted via np.diff masks. Return new length."""
+    view = _as_view(buf)
+    if view is None:
+        return remove_duplicates_sorted(buf)
+
+    def keep(block, prev):
+        mask = np.empty(len(block), dtype=bool)
+        mask[1:] = np.diff(block) != 0          # differs from left neighbour
+        mask[0] = prev is None or block[0] != prev
+        return mask
+
+    return _compact(view, keep)
+
+
+def move_zeroes_buffer(buf):
+    """Move Zeroes on a buffer: compact non-zeros, zero-fill the tail."""
+    view = _as_view(buf)
+    if view is None:
+        write = remove_element(buf, 0)
+        for i in range(write, len(buf)):
+            buf[i] = 0
+        return write
+
+    write = _compact(view, lambda block, prev: block != 0)
+    view[write:] = 0
+    return write